@@ -22,6 +22,34 @@ REVIT_PORT = 48884  # Default pyRevit Routes port
 BASE_URL = f"http://{REVIT_HOST}:{REVIT_PORT}/revit_mcp"
 
 
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use.
+
+    Reusing a single pooled client keeps connections to the Routes server
+    alive between tool calls instead of reconnecting on every request.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            headers={"Content-Type": "application/json"},
+        )
+    return _client
+
+
+async def _close_client():
+    """Close the shared HTTP client if it was created"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
 async def revit_get(endpoint: str, ctx: Context = None, **kwargs) -> Union[Dict, str]:
     """Simple GET request to Revit API"""
     return await _revit_call("GET", endpoint, ctx=ctx, **kwargs)
@@ -35,15 +63,14 @@ async def revit_post(endpoint: str, data: Dict[str, Any], ctx: Context = None, *
 async def revit_image(endpoint: str, ctx: Context = None) -> Union[Image, str]:
     """GET request that returns an Image object"""
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(f"{BASE_URL}{endpoint}")
-            
-            if response.status_code == 200:
-                data = response.json()
-                image_bytes = base64.b64decode(data["image_data"])
-                return Image(data=image_bytes, format="png")
-            else:
-                return f"Error: {response.status_code} - {response.text}"
+        response = await _get_client().get(endpoint, timeout=60.0)
+        
+        if response.status_code == 200:
+            data = response.json()
+            image_bytes = base64.b64decode(data["image_data"])
+            return Image(data=image_bytes, format="png")
+        else:
+            return f"Error: {response.status_code} - {response.text}"
     except Exception as e:
         return f"Error: {e}"
 
@@ -52,15 +79,14 @@ async def _revit_call(method: str, endpoint: str, data: Dict = None, ctx: Contex
                      timeout: float = 30.0, params: Dict = None) -> Union[Dict, str]:
     """Internal function handling all HTTP calls"""
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            url = f"{BASE_URL}{endpoint}"
-            
-            if method == "GET":
-                response = await client.get(url, params=params)
-            else:  # POST
-                response = await client.post(url, json=data, headers={"Content-Type": "application/json"})
-            
-            return response.json() if response.status_code == 200 else f"Error: {response.status_code} - {response.text}"
+        client = _get_client()
+        
+        if method == "GET":
+            response = await client.get(endpoint, params=params, timeout=timeout)
+        else:  # POST
+            response = await client.post(endpoint, json=data, timeout=timeout)
+        
+        return response.json() if response.status_code == 200 else f"Error: {response.status_code} - {response.text}"
     except Exception as e:
         return f"Error: {e}"
 
@@ -70,15 +96,13 @@ from tools import register_tools
 register_tools(mcp, revit_get, revit_post, revit_image)
 
 
-async def run_combined_async():
-    """Run server with both SSE and streamable-http endpoints.
+def build_combined_app():
+    """Build a Starlette app serving both SSE and streamable-http endpoints.
 
     This allows clients to connect via either:
     - SSE: GET /sse, POST /messages/
     - Streamable-HTTP: POST/GET /mcp
     """
-    import uvicorn
-
     # Get the streamable-http app first - it has the proper lifespan
     # that initializes the session manager's task group
     http_app = mcp.streamable_http_app()
@@ -87,18 +111,46 @@ async def run_combined_async():
     # task groups per-request in connect_sse())
     sse_app = mcp.sse_app()
 
-    # Add SSE routes to the http app (preserving its lifespan)
+    # Add SSE routes to the http app (preserving its lifespan). Only the
+    # real SSE paths are added so /mcp keeps its trailing-slash redirect.
     for route in sse_app.routes:
         http_app.routes.append(route)
 
+    return http_app
+
+
+async def run_combined_async():
+    """Run server with both SSE and streamable-http endpoints"""
+    import uvicorn
+
+    http_app = build_combined_app()
+
     config = uvicorn.Config(
         http_app,
         host=mcp.settings.host,
         port=mcp.settings.port,
         log_level=mcp.settings.log_level.lower(),
+        ws="none",  # MCP does not use websockets
+        access_log="--verbose" in sys.argv,
     )
     server = uvicorn.Server(config)
-    await server.serve()
+    try:
+        await server.serve()
+    finally:
+        await _close_client()
+
+
+async def run_transport_async(transport: str):
+    """Run a single FastMCP transport, closing the shared HTTP client on shutdown"""
+    try:
+        if transport == "sse":
+            await mcp.run_sse_async()
+        elif transport == "streamable-http":
+            await mcp.run_streamable_http_async()
+        else:
+            await mcp.run_stdio_async()
+    finally:
+        await _close_client()
 
 
 if __name__ == "__main__":
@@ -114,4 +166,6 @@ if __name__ == "__main__":
         anyio.run(run_combined_async)
         sys.exit(0)
 
-    mcp.run(transport=transport)
\ No newline at end of file
+    # Equivalent to mcp.run(transport=transport), but keeps the shared client
+    # inside the same event loop so it can be closed cleanly
+    anyio.run(run_transport_async, transport)
\ No newline at end of file
@@ -4,15 +4,44 @@ Code Execution Module for Revit MCP
 Handles direct execution of IronPython code in Revit context.
 """
 from pyrevit import routes, revit, DB
+import hashlib
 import json
 import logging
 import sys
 import traceback
+from collections import OrderedDict
 from StringIO import StringIO
 
 # Standard logger setup
 logger = logging.getLogger(__name__)
 
+# Compiled code objects keyed by source hash, most recently used last
+_CODE_CACHE = OrderedDict()
+_CODE_CACHE_SIZE = 256
+
+# Globals shared by every snippet; copied per request before adding doc/uidoc
+_BASE_NAMESPACE = {
+    "DB": DB,
+    "revit": revit,
+    "__builtins__": __builtins__,
+    "__name__": "__mcp_exec__",
+}
+
+
+def _compile_code(source):
+    """
+    Compile source for exec, reusing the cached code object when the same
+    snippet is sent again (common when clients retry or loop over a tool)
+    """
+    key = hashlib.sha1(source.encode("utf-8")).digest()
+    compiled = _CODE_CACHE.pop(key, None)
+    if compiled is None:
+        compiled = compile(source, "<mcp_exec>", "exec")
+        if len(_CODE_CACHE) >= _CODE_CACHE_SIZE:
+            _CODE_CACHE.popitem(last=False)
+    _CODE_CACHE[key] = compiled
+    return compiled
+
 
 def register_code_execution_routes(api):
     """Register code execution routes with the API."""
@@ -50,21 +79,17 @@ def register_code_execution_routes(api):
             captured_output = StringIO()
             sys.stdout = captured_output
 
-            namespace = {
-                "doc": doc,
-                "uidoc": uidoc,
-                "DB": DB,
-                "revit": revit,
-                "__builtins__": __builtins__,
-                "print": lambda *args: captured_output.write(
-                    " ".join(str(arg) for arg in args) + "\n"
-                ),
-            }
+            namespace = _BASE_NAMESPACE.copy()
+            namespace["doc"] = doc
+            namespace["uidoc"] = uidoc
 
+            # print() in the snippet writes through the redirected sys.stdout
             try:
-                exec(code_to_execute, namespace)
+                try:
+                    exec(_compile_code(code_to_execute), namespace)
+                finally:
+                    sys.stdout = old_stdout
 
-                sys.stdout = old_stdout
                 output = captured_output.getvalue()
                 captured_output.close()
 
@@ -82,7 +107,6 @@ def register_code_execution_routes(api):
                 )
 
             except Exception as exec_error:
-                sys.stdout = old_stdout
                 partial_output = captured_output.getvalue()
                 captured_output.close()
 
@@ -8,11 +8,121 @@ from pyrevit import routes, revit, DB
 from pyrevit.revit.db import ProjectInfo as RevitProjectInfo
 import pyrevit.revit.db.query as q
 import logging
+from System import AppDomain
 
 from utils import normalize_string, get_element_name
 
 logger = logging.getLogger(__name__)
 
+# Revit enum values used by get_model_info, resolved once at import time
+# instead of through the .NET interop layer on every request
+_CAT = DB.BuiltInCategory
+_VT = DB.ViewType
+
+# Major model categories reported in the element summary
+ELEMENT_CATEGORIES = (
+    ("Walls", _CAT.OST_Walls),
+    ("Floors", _CAT.OST_Floors),
+    ("Ceilings", _CAT.OST_Ceilings),
+    ("Roofs", _CAT.OST_Roofs),
+    ("Doors", _CAT.OST_Doors),
+    ("Windows", _CAT.OST_Windows),
+    ("Stairs", _CAT.OST_Stairs),
+    ("Railings", _CAT.OST_Railings),
+    ("Columns", _CAT.OST_Columns),
+    ("Structural_Framing", _CAT.OST_StructuralFraming),
+    ("Furniture", _CAT.OST_Furniture),
+    ("Lighting_Fixtures", _CAT.OST_LightingFixtures),
+    ("Plumbing_Fixtures", _CAT.OST_PlumbingFixtures),
+)
+
+_CAT_LEVELS = _CAT.OST_Levels
+_CAT_ROOMS = _CAT.OST_Rooms
+_CAT_SHEETS = _CAT.OST_Sheets
+
+_VT_FLOOR_PLAN = _VT.FloorPlan
+_VT_ELEVATION = _VT.Elevation
+_VT_SECTION = _VT.Section
+_VT_THREE_D = _VT.ThreeD
+_VT_SCHEDULE = _VT.Schedule
+_COUNTED_VIEW_TYPES = (
+    _VT_FLOOR_PLAN,
+    _VT_ELEVATION,
+    _VT_SECTION,
+    _VT_THREE_D,
+    _VT_SCHEDULE,
+)
+_EXCLUDED_VIEW_TYPES = (_VT.Internal, _VT.ProjectBrowser)
+
+_ROOM_NAME = DB.BuiltInParameter.ROOM_NAME
+_ROOM_NUMBER = DB.BuiltInParameter.ROOM_NUMBER
+_WARNING_ERROR = DB.WarningType.Error
+
+# Last model_info payload per document, dropped whenever that document
+# is modified or closed
+_model_info_cache = {}
+_watching_documents = False
+# AppDomain slot holding the subscribed handler, which outlives pyRevit
+# reloads of this module
+_HANDLER_SLOT = "revit_mcp.model_info.document_handler"
+
+
+def _document_key(doc):
+    """Key identifying a document in the module caches"""
+    return doc.PathName or doc.Title
+
+
+def _on_document_event(sender, args):
+    """Invalidate cached data for a document that changed, closes or is saved as"""
+    try:
+        if hasattr(args, "GetDocument"):
+            doc = args.GetDocument()
+        else:
+            doc = args.Document
+        doc_key = _document_key(doc)
+        _model_info_cache.pop(doc_key, None)
+    except Exception:
+        _model_info_cache.clear()
+
+
+def _watch_documents(doc):
+    """
+    Subscribe to application document events once so cached data can be
+    invalidated. Returns False if the subscription is not available, in
+    which case nothing should be cached.
+    """
+    global _watching_documents
+    if not _watching_documents:
+        try:
+            app = doc.Application
+            # Drop the handler left behind by a previous load of this module
+            domain = AppDomain.CurrentDomain
+            previous = domain.GetData(_HANDLER_SLOT)
+            if previous is not None:
+                app.DocumentChanged -= previous
+                app.DocumentClosing -= previous
+                app.DocumentSavingAs -= previous
+            app.DocumentChanged += _on_document_event
+            app.DocumentClosing += _on_document_event
+            # Save As changes PathName, so evict the entry under the old key
+            app.DocumentSavingAs += _on_document_event
+            domain.SetData(_HANDLER_SLOT, _on_document_event)
+            _watching_documents = True
+        except Exception as e:
+            logger.warning("Could not watch document changes: {}".format(str(e)))
+    return _watching_documents
+
+
+def _count_warnings(doc):
+    """Count the document's warnings as (total, critical)"""
+    warnings = doc.GetWarnings()
+    # Tally warnings by severity in one pass
+    severity_counts = {}
+    for w in warnings:
+        severity = w.GetSeverity()
+        severity_counts[severity] = severity_counts.get(severity, 0) + 1
+    return len(warnings), severity_counts.get(_WARNING_ERROR, 0)
+
 
 def register_model_info_routes(api):
     """Register all model information routes with the API"""
@@ -37,6 +147,15 @@ def register_model_info_routes(api):
                     data={"error": "No active Revit document"}, status=503
                 )
 
+            # Serve the previous payload while the document is unchanged
+            doc_key = _document_key(doc)
+            use_cache = _watch_documents(doc)
+            if use_cache and doc_key in _model_info_cache:
+                return routes.make_response(data=_model_info_cache[doc_key])
+            # Set when a section falls back to defaults; such a payload is
+            # returned but not cached
+            degraded = False
+
             # ============ PROJECT INFORMATION ============
             try:
                 revit_project_info = RevitProjectInfo(doc)
@@ -48,6 +167,7 @@ def register_model_info_routes(api):
                 }
             except Exception as e:
                 logger.warning("Could not get full project info: {}".format(str(e)))
+                degraded = True
                 project_info = {
                     "name": normalize_string(doc.Title),
                     "number": "Not Set",
@@ -56,26 +176,10 @@ def register_model_info_routes(api):
                 }
 
             # ============ ELEMENT COUNTS ============
-            element_categories = {
-                "Walls": DB.BuiltInCategory.OST_Walls,
-                "Floors": DB.BuiltInCategory.OST_Floors,
-                "Ceilings": DB.BuiltInCategory.OST_Ceilings,
-                "Roofs": DB.BuiltInCategory.OST_Roofs,
-                "Doors": DB.BuiltInCategory.OST_Doors,
-                "Windows": DB.BuiltInCategory.OST_Windows,
-                "Stairs": DB.BuiltInCategory.OST_Stairs,
-                "Railings": DB.BuiltInCategory.OST_Railings,
-                "Columns": DB.BuiltInCategory.OST_Columns,
-                "Structural_Framing": DB.BuiltInCategory.OST_StructuralFraming,
-                "Furniture": DB.BuiltInCategory.OST_Furniture,
-                "Lighting_Fixtures": DB.BuiltInCategory.OST_LightingFixtures,
-                "Plumbing_Fixtures": DB.BuiltInCategory.OST_PlumbingFixtures,
-            }
-
             element_counts = {}
             total_elements = 0
 
-            for name, category in element_categories.items():
+            for name, category in ELEMENT_CATEGORIES:
                 try:
                     count = (
                         DB.FilteredElementCollector(doc)
@@ -87,26 +191,22 @@ def register_model_info_routes(api):
                     total_elements += count
                 except:
                     element_counts[name] = 0
+                    degraded = True
 
             # ============ WARNINGS ============
             try:
-                warnings = doc.GetWarnings()
-                warnings_count = len(warnings)
-                # Count critical warnings (simplified check)
-                critical_warnings = sum(
-                    1 for w in warnings if w.GetSeverity() == DB.WarningType.Error
-                )
+                warnings_count, critical_warnings = _count_warnings(doc)
             except:
                 warnings_count = 0
                 critical_warnings = 0
+                degraded = True
 
             # ============ LEVELS ============
             try:
                 levels_collector = (
                     DB.FilteredElementCollector(doc)
-                    .OfCategory(DB.BuiltInCategory.OST_Levels)
+                    .OfCategory(_CAT_LEVELS)
                     .WhereElementIsNotElementType()
-                    .ToElements()
                 )
 
                 levels_info = []
@@ -143,43 +243,47 @@ def register_model_info_routes(api):
             except Exception as e:
                 logger.warning("Could not get levels: {}".format(str(e)))
                 levels_info = []
+                degraded = True
 
             # ============ ROOMS ============
             try:
                 rooms_collector = (
                     DB.FilteredElementCollector(doc)
-                    .OfCategory(DB.BuiltInCategory.OST_Rooms)
+                    .OfCategory(_CAT_ROOMS)
                     .WhereElementIsNotElementType()
-                    .ToElements()
                 )
 
                 rooms_info = []
                 unplaced_rooms = 0
+                level_names = {}
 
                 for room in rooms_collector:
                     try:
-                        # Get room name safely
-                        name_param = room.LookupParameter("Name")
-                        room_name = (
-                            name_param.AsString()
-                            if name_param and name_param.HasValue
-                            else "Unnamed Room"
-                        )
-
-                        # Get room number safely
-                        number_param = room.LookupParameter("Number")
+                        # Get room name and number by built-in parameter
+                        # rather than a display-name lookup
+                        name_param = room.get_Parameter(_ROOM_NAME)
+                        room_name = name_param.AsString() if name_param else None
+                        if room_name is None:
+                            room_name = "Unnamed Room"
+
+                        number_param = room.get_Parameter(_ROOM_NUMBER)
                         room_number = (
-                            number_param.AsString()
-                            if number_param and number_param.HasValue
-                            else ""
+                            number_param.AsString() if number_param else None
                         )
+                        if room_number is None:
+                            room_number = ""
 
-                        # Get room level
+                        # Get room level, resolving each level only once
                         level_name = "Unknown Level"
                         try:
-                            level = doc.GetElement(room.LevelId)
-                            if level:
-                                level_name = get_element_name(level)
+                            level_id = room.LevelId.IntegerValue
+                            if level_id in level_names:
+                                level_name = level_names[level_id]
+                            else:
+                                level = doc.GetElement(room.LevelId)
+                                if level:
+                                    level_name = get_element_name(level)
+                                level_names[level_id] = level_name
                         except:
                             pass
 
@@ -210,83 +314,88 @@ def register_model_info_routes(api):
 
                     except Exception as e:
                         logger.warning("Could not process room: {}".format(str(e)))
+                        degraded = True
                         continue
 
             except Exception as e:
                 logger.warning("Could not get rooms: {}".format(str(e)))
                 rooms_info = []
                 unplaced_rooms = 0
+                degraded = True
 
             # ============ VIEWS AND SHEETS ============
             try:
                 # Get sheets
                 sheets_count = (
                     DB.FilteredElementCollector(doc)
-                    .OfCategory(DB.BuiltInCategory.OST_Sheets)
+                    .OfCategory(_CAT_SHEETS)
                     .WhereElementIsNotElementType()
                     .GetElementCount()
                 )
 
-                # Get views (excluding templates and invalid types)
-                all_views = (
-                    DB.FilteredElementCollector(doc).OfClass(DB.View).ToElements()
-                )
+                # Get views (excluding templates and invalid types); the
+                # collector is iterated lazily rather than materialized
+                all_views = DB.FilteredElementCollector(doc).OfClass(DB.View)
 
-                valid_views = [
-                    v
-                    for v in all_views
-                    if hasattr(v, "IsTemplate")
-                    and not v.IsTemplate
-                    and v.ViewType != DB.ViewType.Internal
-                    and v.ViewType != DB.ViewType.ProjectBrowser
-                ]
+                # Classify views in one pass, reading ViewType once per view
+                view_type_counts = dict.fromkeys(_COUNTED_VIEW_TYPES, 0)
+                views_count = 0
 
-                views_count = len(valid_views)
+                # OfClass(DB.View) only yields views, which all expose
+                # IsTemplate, so no per-view hasattr probe is needed
+                for v in all_views:
+                    if v.IsTemplate:
+                        continue
+                    view_type = v.ViewType
+                    if view_type in _EXCLUDED_VIEW_TYPES:
+                        continue
+                    views_count += 1
+                    if view_type in view_type_counts:
+                        view_type_counts[view_type] += 1
 
                 # Count major view types
-                floor_plans = sum(
-                    1 for v in valid_views if v.ViewType == DB.ViewType.FloorPlan
-                )
-                elevations = sum(
-                    1 for v in valid_views if v.ViewType == DB.ViewType.Elevation
-                )
-                sections = sum(
-                    1 for v in valid_views if v.ViewType == DB.ViewType.Section
-                )
-                threed_views = sum(
-                    1 for v in valid_views if v.ViewType == DB.ViewType.ThreeD
-                )
-                schedules = sum(
-                    1 for v in valid_views if v.ViewType == DB.ViewType.Schedule
-                )
+                floor_plans = view_type_counts[_VT_FLOOR_PLAN]
+                elevations = view_type_counts[_VT_ELEVATION]
+                sections = view_type_counts[_VT_SECTION]
+                threed_views = view_type_counts[_VT_THREE_D]
+                schedules = view_type_counts[_VT_SCHEDULE]
 
             except Exception as e:
                 logger.warning("Could not get views/sheets: {}".format(str(e)))
                 sheets_count = 0
                 views_count = 0
                 floor_plans = elevations = sections = threed_views = schedules = 0
+                degraded = True
 
             # ============ LINKED MODELS ============
             try:
                 linked_models = []
                 rvt_links = q.get_linked_model_instances(doc).ToElements()
+                has_link_name = hasattr(q, "get_rvt_link_instance_name")
+                # Load status per link type id; instances of the same linked
+                # file share a type, so each type is resolved only once
+                link_statuses = {}
 
                 for link_instance in rvt_links:
                     try:
                         link_doc = link_instance.GetLinkDocument()
                         link_name = (
                             q.get_rvt_link_instance_name(link_instance)
-                            if hasattr(q, "get_rvt_link_instance_name")
+                            if has_link_name
                             else "Unknown Link"
                         )
 
                         # Get load status
-                        link_type = doc.GetElement(link_instance.GetTypeId())
-                        status = normalize_string(
-                            str(link_type.GetLinkedFileStatus()).split(".")[-1]
-                            if link_type
-                            else "Unknown"
-                        )
+                        type_id = link_instance.GetTypeId()
+                        status = link_statuses.get(type_id.IntegerValue)
+                        if status is None:
+                            link_type = doc.GetElement(type_id)
+                            status = normalize_string(
+                                str(link_type.GetLinkedFileStatus()).rsplit(".", 1)[-1]
+                                if link_type
+                                else "Unknown"
+                            )
+                            link_statuses[type_id.IntegerValue] = status
 
                         # Check if pinned
                         is_pinned = getattr(link_instance, "Pinned", False)
@@ -304,11 +413,13 @@ def register_model_info_routes(api):
                         logger.warning(
                             "Could not process linked model: {}".format(str(e))
                         )
+                        degraded = True
                         continue
 
             except Exception as e:
                 logger.warning("Could not get linked models: {}".format(str(e)))
                 linked_models = []
+                degraded = True
 
             # ============ COMPILE RESPONSE ============
             model_data = {
@@ -342,6 +453,9 @@ def register_model_info_routes(api):
                 "linked_models": {"count": len(linked_models), "models": linked_models},
             }
 
+            if use_cache and not degraded:
+                _model_info_cache[doc_key] = model_data
+
             return routes.make_response(data=model_data)
 
         except Exception as e:
@@ -17,17 +17,17 @@ def normalize_string(text):
     By returning unicode we guarantee the JSON serialiser receives a proper
     text object regardless of the locale of the Revit model.
     """
+    # Already a unicode string (normal case for .NET System.String in
+    # IronPython); exact class check keeps the hot path cheap
+    if text.__class__ is unicode:
+        return text.strip()
     if text is None:
         return u"Unnamed"
-    # Already a unicode string (normal case for .NET System.String in IronPython)
     if isinstance(text, unicode):
         return text.strip()
-    # Byte string — decode with a permissive fallback
+    # Byte string — the replace handler never raises
     if isinstance(text, str):
-        try:
-            return text.decode("utf-8").strip()
-        except (UnicodeDecodeError, AttributeError):
-            return text.decode("latin-1").strip()
+        return text.decode("utf-8", "replace").strip()
     # Any other type (.NET object, int, etc.) — convert via unicode()
     try:
         return unicode(text).strip()
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""Tests for the combined SSE + streamable-http app"""
+
+from starlette.testclient import TestClient
+
+import main
+
+
+def test_combined_app_routes_mcp_and_sse():
+    app = main.build_combined_app()
+    initialize = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": "2025-03-26",
+            "capabilities": {},
+            "clientInfo": {"name": "test", "version": "0"},
+        },
+    }
+    headers = {"Accept": "application/json, text/event-stream"}
+
+    # The session manager can only be started once, so a single client
+    # (and lifespan) covers every check
+    with TestClient(app) as client:
+        # /mcp without a trailing slash still redirects to the mounted app
+        response = client.post(
+            "/mcp", json=initialize, headers=headers, follow_redirects=False
+        )
+        assert response.status_code == 307
+        assert response.headers["location"].endswith("/mcp/")
+
+        # ...and reaches the streamable-http session manager
+        response = client.post("/mcp", json=initialize, headers=headers)
+        assert response.status_code == 200
+        assert response.json()["result"]["serverInfo"]["name"] == "Revit MCP Server"
+
+        # SSE message endpoint is served from the same app
+        response = client.post("/messages/", json={})
+        assert response.status_code == 400
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""Tests for MCP tool response formatting"""
+
+from tools.utils import format_response
+
+
+def test_json_fallback_handles_values_orjson_rejects():
+    response = {"status": "success", "big": 2**70, "l": [1]}
+    assert format_response(response) == (
+        '{"status":"success","big":1180591620717411303424,"l":[1]}'
+    )
+
+
+def test_only_small_status_payloads_are_cached():
+    from tools.utils import _format_flat_dict
+
+    _format_flat_dict.cache_clear()
+    format_response({"status": "active", "health": "healthy", "api_name": "revit_mcp"})
+    format_response(
+        {"status": "success", "output": "x" * 10, "code_executed": "print(1)"}
+    )
+    format_response({"status": "error", "error": "x" * 5000})
+    assert _format_flat_dict.cache_info().currsize == 1
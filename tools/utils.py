@@ -1,6 +1,99 @@
 # -*- coding: utf-8 -*-
 """Utility functions for MCP tools"""
 
+import json
+import os
+from functools import lru_cache
+from itertools import combinations
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib encoder
+    orjson = None
+
+# Responses are read by an LLM, so JSON is emitted compact unless
+# REVIT_MCP_PRETTY_JSON is set for debugging
+_PRETTY_JSON = bool(os.environ.get("REVIT_MCP_PRETTY_JSON"))
+
+
+def _dumps(obj):
+    """Serialize obj as JSON, using orjson when it is installed.
+
+    orjson rejects some values the stdlib accepts (e.g. integers beyond
+    64 bits), so those fall back to json.dumps. Note that orjson writes
+    NaN/Infinity as null, where json.dumps writes the non-standard NaN.
+    """
+    if orjson is not None:
+        try:
+            if _PRETTY_JSON:
+                return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+            return orjson.dumps(obj).decode()
+        except TypeError:  # includes orjson.JSONEncodeError
+            pass
+    if _PRETTY_JSON:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+# Success payload fields in priority order, with the converter applied to
+# the value (None returns it as-is)
+_SUCCESS_FIELDS = (
+    ("output", None),  # Code execution responses
+    ("message", None),
+    ("result", str),
+    ("data", str),
+)
+_SUCCESS_KEYS = frozenset(field for field, _ in _SUCCESS_FIELDS)
+# Present success fields -> (field, converter) of the highest-priority one,
+# precomputed for every combination so dispatch is a single dict lookup
+_SUCCESS_HANDLERS = {}
+for _count in range(1, len(_SUCCESS_FIELDS) + 1):
+    for _combo in combinations(_SUCCESS_FIELDS, _count):
+        _SUCCESS_HANDLERS[frozenset(field for field, _ in _combo)] = _combo[0]
+del _count, _combo
+
+# Value types of flat responses whose formatted text can be cached
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+# Total string length above which a response is not worth caching
+_MAX_CACHED_TEXT = 1024
+
+# Fields rendered explicitly in the status summary
+_KNOWN_STATUS_FIELDS = frozenset(
+    {"status", "health", "api_name", "document_title", "revit_available"}
+)
+# Debugging fields listed, in this order, in error reports
+_DEBUG_FIELDS = ("code_attempted", "endpoint", "request_data", "response_code")
+# Fields already covered by the error report before the additional data
+_ERROR_RESERVED = frozenset({"error", "traceback", "details", "status"}).union(
+    _DEBUG_FIELDS
+)
+
+
+def _stringify(value):
+    """Text for a response value; nested lists/dicts are rendered as JSON"""
+    if value.__class__ is str:
+        return value
+    if isinstance(value, (list, dict)):
+        try:
+            return _dumps(value)
+        except (TypeError, ValueError):
+            pass
+    return str(value)
+
+
+_EMPTY_RESPONSE = "=== ERROR DETAILS ===\nStatus: empty\nError: empty response"
+
+# Display labels for response field names, filled on first use
+_LABEL_CACHE = {}
+
+
+def _label(field):
+    """Human-readable label for a response field, e.g. api_name -> Api Name"""
+    label = _LABEL_CACHE.get(field)
+    if label is None:
+        label = _LABEL_CACHE[field] = field.replace("_", " ").title()
+    return label
+
 
 def format_response(response):
     """Helper function to format API responses consistently for MCP tools.
@@ -11,84 +104,129 @@ def format_response(response):
     Returns:
         str: Formatted string response suitable for MCP tool return values
     """
+    # Already a string (error case from _revit_call)
+    if response.__class__ is str:
+        return response
+
     if isinstance(response, dict):
-        # Check for different success patterns
-        status = response.get("status", "").lower()
-        health = response.get("health", "").lower()
-        
-        # Success conditions: status="success" OR status="active" with health="healthy"
-        is_success = (status == "success" or 
-                     (status == "active" and health == "healthy") or
-                     (status == "active" and "revit_available" in response and response["revit_available"]))
-        
-        if is_success:
-            # For successful responses, return the most relevant data
-            if "output" in response:  # Code execution responses
-                return response["output"]
-            elif "message" in response:
-                return response["message"]
-            elif "result" in response:
-                return str(response["result"])
-            elif "data" in response:
-                return str(response["data"])
-            elif status == "active":  # Status check responses
-                # Format status response nicely
-                status_parts = ["=== REVIT STATUS ==="]
-                status_parts.append("Status: {}".format(response.get("status", "Unknown")))
-                status_parts.append("Health: {}".format(response.get("health", "Unknown")))
-                
-                if "api_name" in response:
-                    status_parts.append("API: {}".format(response["api_name"]))
-                if "document_title" in response:
-                    status_parts.append("Document: {}".format(response["document_title"]))
-                if "revit_available" in response:
-                    status_parts.append("Revit Available: {}".format(response["revit_available"]))
-                
-                # Add any other fields that might be present
-                known_fields = {"status", "health", "api_name", "document_title", "revit_available"}
-                other_fields = set(response.keys()) - known_fields
-                if other_fields:
-                    status_parts.append("")
-                    for field in sorted(other_fields):
-                        status_parts.append("{}: {}".format(field.replace("_", " ").title(), response[field]))
-                
-                return "\n".join(status_parts)
-            else:
-                import json
-                return json.dumps(response, indent=2)
-        else:
-            # Error case - provide verbose debugging information
-            error_msg = response.get("error", "Unknown error occurred")
-            traceback_info = response.get("traceback", "")
-            details = response.get("details", "")
-            status = response.get("status", "unknown")
-            
-            # Build comprehensive error message
-            error_parts = ["=== ERROR DETAILS ==="]
-            error_parts.append("Status: {}".format(status))
-            error_parts.append("Error: {}".format(error_msg))
-            
-            if details:
-                error_parts.append("Details: {}".format(details))
-            
-            if traceback_info:  # Code execution error with traceback
-                error_parts.append("\n=== TRACEBACK ===")
-                error_parts.append(traceback_info)
+        if not response:
+            return _EMPTY_RESPONSE
+
+        # Small status-style payloads repeat often, so their formatted text
+        # is cached. The value class is part of the key so True, 1 and 1.0
+        # are not conflated.
+        if _is_cacheable(response):
+            return _format_flat_dict(
+                tuple((key, value.__class__, value) for key, value in response.items())
+            )
+        return _format_dict(response)
+    else:
+        return str(response)
+
+
+def _is_cacheable(response):
+    """
+    True for small flat payloads without output/message/result/data, such
+    as status checks; code execution results and the like never repeat
+    """
+    if not response.keys().isdisjoint(_SUCCESS_KEYS):
+        return False
+    text_size = 0
+    for value in response.values():
+        value_class = value.__class__
+        if value_class not in _SCALAR_TYPES:
+            return False
+        if value_class is str:
+            text_size += len(value)
+            if text_size > _MAX_CACHED_TEXT:
+                return False
+    return True
+
+
+@lru_cache(maxsize=128)
+def _format_flat_dict(items):
+    """Cached _format_dict for dicts whose values are all scalars"""
+    return _format_dict({key: value for key, _, value in items})
+
+
+def _format_dict(response):
+    """Format a dict response from the Revit API"""
+    get = response.get
+
+    # Check for different success patterns, reading each field once
+    status = get("status")
+    status = status.lower() if isinstance(status, str) else ""
+    health = get("health")
+    health = health.lower() if isinstance(health, str) else ""
+    
+    # Success conditions: status="success" OR status="active" with
+    # health="healthy" or revit_available set
+    is_success = status == "success" or (
+        status == "active" and (health == "healthy" or bool(get("revit_available")))
+    )
+    
+    if is_success:
+        # For successful responses, return the most relevant data
+        present = response.keys() & _SUCCESS_KEYS
+        if present:
+            field, convert = _SUCCESS_HANDLERS[frozenset(present)]
+            value = response[field]
+            return convert(value) if convert else value
+
+        if status == "active":  # Status check responses
+            # Format status response nicely
+            status_parts = [
+                f"=== REVIT STATUS ===\n"
+                f"Status: {get('status', 'Unknown')}\n"
+                f"Health: {get('health', 'Unknown')}"
+            ]
             
-            # Add any additional fields that might be helpful for debugging
-            debug_fields = ["code_attempted", "endpoint", "request_data", "response_code"]
-            for field in debug_fields:
-                if field in response:
-                    error_parts.append("{}: {}".format(field.replace("_", " ").title(), response[field]))
+            if "api_name" in response:
+                status_parts.append(f"API: {response['api_name']}")
+            if "document_title" in response:
+                status_parts.append(f"Document: {response['document_title']}")
+            if "revit_available" in response:
+                status_parts.append(f"Revit Available: {response['revit_available']}")
             
-            # Include full response for debugging if it has unexpected fields
-            response_keys = set(response.keys()) - {"error", "traceback", "details", "status", "code_attempted", "endpoint", "request_data", "response_code"}
-            if response_keys:
-                error_parts.append("\n=== ADDITIONAL RESPONSE DATA ===")
-                for key in sorted(response_keys):
-                    error_parts.append("{}: {}".format(key, response[key]))
+            # Add any other fields that might be present
+            other_fields = response.keys() - _KNOWN_STATUS_FIELDS
+            if other_fields:
+                status_parts.append("")
+                # Keep the response's own field order rather than sorting
+                for field in response:
+                    if field in other_fields:
+                        status_parts.append(f"{_label(field)}: {response[field]}")
             
-            return "\n".join(error_parts)
+            return "\n".join(status_parts)
+        else:
+            return _dumps(response)
     else:
-        # If response is already a string (error case from _revit_call)
-        return str(response)
+        # Error case - provide verbose debugging information
+        error_msg = get("error", "Unknown error occurred")
+        traceback_info = get("traceback", "")
+        details = get("details", "")
+        status = get("status", "unknown")
+        
+        # Build comprehensive error message
+        error_parts = [f"=== ERROR DETAILS ===\nStatus: {status}\nError: {error_msg}"]
+        
+        if details:
+            error_parts.append(f"Details: {details}")
+        
+        if traceback_info:  # Code execution error with traceback
+            error_parts.append(f"\n=== TRACEBACK ===\n{traceback_info}")
+        
+        # Add any additional fields that might be helpful for debugging
+        for field in _DEBUG_FIELDS:
+            if field in response:
+                error_parts.append(f"{_label(field)}: {_stringify(response[field])}")
+        
+        # Include full response for debugging if it has unexpected fields
+        response_keys = response.keys() - _ERROR_RESERVED
+        if response_keys:
+            error_parts.append("\n=== ADDITIONAL RESPONSE DATA ===")
+            for key in response:
+                if key in response_keys:
+                    error_parts.append(f"{key}: {_stringify(response[key])}")
+        
+        return "\n".join(error_parts)
@@ -1,10 +1,22 @@
 # -*- coding: utf-8 -*-
 """View-related tools for capturing and listing Revit views"""
 
+import asyncio
+
 from mcp.server.fastmcp import Context
 from .utils import format_response
 
 
+def _format_views_by_type(views_by_type, total_views):
+    """Render the /list_views/ groups as plain text, one view name per line"""
+    lines = [f"Total exportable views: {total_views}"]
+    for view_type, view_names in views_by_type.items():
+        if view_names:
+            lines.append(f"\n{view_type.replace('_', ' ').title()} ({len(view_names)}):")
+            lines.extend(f"- {name}" for name in view_names)
+    return "\n".join(lines)
+
+
 def register_view_tools(mcp, revit_get, revit_post, revit_image):
     """Register view-related tools"""
 
@@ -17,6 +29,12 @@ def register_view_tools(mcp, revit_get, revit_post, revit_image):
     async def list_revit_views(ctx: Context = None) -> str:
         """Get a list of all exportable views in the current Revit model"""
         response = await revit_get("/list_views/", ctx)
+        # Join view names directly rather than dumping the whole dict as JSON
+        if isinstance(response, dict) and isinstance(response.get("views_by_type"), dict):
+            return _format_views_by_type(
+                response["views_by_type"],
+                response.get("total_exportable_views", "Unknown"),
+            )
         return format_response(response)
 
     @mcp.tool()
@@ -33,8 +51,13 @@ def register_view_tools(mcp, revit_get, revit_post, revit_image):
         - Template status
         """
         if ctx:
-            await ctx.info("Getting current view information...")
-        response = await revit_get("/current_view_info/", ctx)
+            # Send the log message while the request is in flight
+            _, response = await asyncio.gather(
+                ctx.info("Getting current view information..."),
+                revit_get("/current_view_info/", ctx),
+            )
+        else:
+            response = await revit_get("/current_view_info/", ctx)
         return format_response(response)
 
     @mcp.tool()
@@ -53,6 +76,11 @@ def register_view_tools(mcp, revit_get, revit_post, revit_image):
         and analyzing the content of the active view.
         """
         if ctx:
-            await ctx.info("Getting elements in current view...")
-        response = await revit_get("/current_view_elements/", ctx)
+            # Send the log message while the request is in flight
+            _, response = await asyncio.gather(
+                ctx.info("Getting elements in current view..."),
+                revit_get("/current_view_elements/", ctx),
+            )
+        else:
+            response = await revit_get("/current_view_elements/", ctx)
         return format_response(response)